@@ -2,29 +2,140 @@
 import datetime  # Used for date and time in sale records
 import json  # For saving and loading inventory and sales data to/from JSON files
 import os  # For checking file existence when loading data
+import sys  # For writing reports to stdout in a single call
+import mmap  # For reading data files without copying them into a Python string
+import stat  # For telling regular files apart from pipes when reading data files
+from collections import defaultdict  # For grouping sales by day
 import logging  # For logging operations such as adding items or recording sales
+import logging.handlers  # For handing log records to a background thread
+import queue  # Buffers log records between the caller and the log writer thread
+import atexit  # For flushing buffered log records on exit
+
+try:
+    import orjson  # Faster JSON serialization for saving and loading data, if installed
+except ImportError:
+    orjson = None
+
+
+def _configure_logging():
+    """Configures logging to write logs to a file with specific format."""
+    root = logging.getLogger()
+    if root.handlers:  # Like logging.basicConfig, leave an already configured root logger alone
+        return
+    # Callers only enqueue records; a background listener writes them to the file
+    log_queue = queue.Queue(-1)
+    file_handler = logging.FileHandler('store_log.txt')
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    listener.start()
+    atexit.register(listener.stop)
+
+
+_configure_logging()
+
+logger = logging.getLogger(__name__)
+
+# Naive epoch for storing sale dates as wall-clock seconds, independent of the local timezone
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def _write_json(filename, data):
+    """Writes data to a JSON file, using orjson when it is available."""
+    if orjson is not None:
+        with open(filename, 'wb') as file:
+            file.write(orjson.dumps(data))
+    else:
+        with open(filename, 'w') as file:
+            json.dump(data, file)
+
 
-# Configure logging settings to write logs to a file with specific format
-logging.basicConfig(filename='store_log.txt', level=logging.INFO, 
-                    format='%(asctime)s - %(levelname)s - %(message)s')
+def _read_json(filename):
+    """Reads data from a JSON file, using orjson when it is available."""
+    if orjson is not None:
+        with open(filename, 'rb') as file:
+            # Only non-empty regular files can be mapped; pipes and FIFOs also report size 0
+            file_stat = os.fstat(file.fileno())
+            if not (stat.S_ISREG(file_stat.st_mode) and file_stat.st_size > 0):
+                return orjson.loads(file.read())
+            # Parse straight from a memory map to avoid holding a second copy of the file
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                    memoryview(mapped) as view:
+                return orjson.loads(view)
+    with open(filename, 'r') as file:
+        return json.load(file)
 
 
 class Item:
     """Class to represent an item in inventory."""
 
+    __slots__ = ('_item_id', '_name', '_price', '_quantity', '_discount', '_str_cache')
+
     def __init__(self, item_id, name, price, quantity=0):
         # Initialize the Item with ID, name, price, quantity, and discount attributes
         self.item_id = item_id
-        self.name = name
+        self.name = name  # Use Inventory.rename_item to rename an item already in inventory
         self.price = price
         self.quantity = quantity
         self.discount = 0  # In percentage, default is 0
+        self._str_cache = None  # Cached __str__ output, cleared when any displayed attribute changes
+
+    @property
+    def item_id(self):
+        """Unique ID of the item."""
+        return self._item_id
+
+    @item_id.setter
+    def item_id(self, value):
+        self._item_id = value
+        self._str_cache = None
+
+    @property
+    def name(self):
+        """Name of the item."""
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+        self._str_cache = None
+
+    @property
+    def price(self):
+        """Price before discount."""
+        return self._price
+
+    @price.setter
+    def price(self, value):
+        self._price = value
+        self._str_cache = None
+
+    @property
+    def quantity(self):
+        """Number of units in stock."""
+        return self._quantity
+
+    @quantity.setter
+    def quantity(self, value):
+        self._quantity = value
+        self._str_cache = None
+
+    @property
+    def discount(self):
+        """Discount in percentage."""
+        return self._discount
+
+    @discount.setter
+    def discount(self, value):
+        self._discount = value
+        self._str_cache = None
 
     def set_discount(self, discount_percent):
         """Sets a discount on the item if within 0-100%."""
         if 0 <= discount_percent <= 100:
             self.discount = discount_percent
-            logging.info(f"Discount set for {self.name}: {self.discount}%")
+            logger.info("Discount set for %s: %s%%", self.name, self.discount)
         else:
             raise ValueError("Discount percent must be between 0 and 100.")
 
@@ -34,7 +145,9 @@ class Item:
 
     def __str__(self):
         """Returns a string representation of the item."""
-        return f"{self.name} (ID: {self.item_id}) - ${self.get_discounted_price():.2f} x {self.quantity} units"
+        if self._str_cache is None:
+            self._str_cache = f"{self.name} (ID: {self.item_id}) - ${self.get_discounted_price():.2f} x {self.quantity} units"
+        return self._str_cache
 
     def to_dict(self):
         """Converts item details to a dictionary for easy JSON serialization."""
@@ -60,20 +173,41 @@ class Inventory:
     def __init__(self):
         # Initialize inventory with an empty dictionary of items
         self.items = {}
+        self._names_lower = {}  # Lowercased item names by ID, used by search_items
 
     def add_item(self, item):
         """Adds a new item to inventory if ID is unique."""
         if item.item_id in self.items:
             raise ValueError("Item ID already exists.")
         self.items[item.item_id] = item
-        logging.info(f"Added item to inventory: {item}")
+        self._names_lower[item.item_id] = item.name.lower()
+        logger.info("Added item to inventory: %s", item)
+
+    def add_items_bulk(self, items):
+        """Adds many items at once, logging one summary line instead of one per item."""
+        items = list(items)
+        names_lower = {item.item_id: item.name.lower() for item in items}
+        if len(names_lower) != len(items) or not names_lower.keys().isdisjoint(self.items):
+            raise ValueError("Item ID already exists.")
+        for item in items:
+            self.items[item.item_id] = item
+        self._names_lower.update(names_lower)
+        logger.info("Bulk-added %d items to inventory", len(items))
+
+    def rename_item(self, item_id, name):
+        """Renames an existing item, keeping the search index up to date."""
+        if item_id not in self.items:
+            raise ValueError("Item ID does not exist.")
+        self.items[item_id].name = name
+        self._names_lower[item_id] = name.lower()
+        logger.info("Renamed item %s to %s", item_id, name)
 
     def update_quantity(self, item_id, quantity):
         """Updates quantity of an existing item."""
         if item_id not in self.items:
             raise ValueError("Item ID does not exist.")
         self.items[item_id].quantity = quantity
-        logging.info(f"Updated quantity for item {self.items[item_id].name}: {quantity}")
+        logger.info("Updated quantity for item %s: %s", self.items[item_id].name, quantity)
 
     def apply_discount_to_item(self, item_id, discount_percent):
         """Applies a discount to a single item based on item ID."""
@@ -83,9 +217,12 @@ class Inventory:
 
     def apply_discount_to_all(self, discount_percent):
         """Applies a discount to all items in inventory."""
+        # Validate once up front, then assign directly to skip per-item logging
+        if not 0 <= discount_percent <= 100:
+            raise ValueError("Discount percent must be between 0 and 100.")
         for item in self.items.values():
-            item.set_discount(discount_percent)
-        logging.info(f"Applied {discount_percent}% discount to all items")
+            item.discount = discount_percent
+        logger.info("Applied %s%% discount to all items", discount_percent)
 
     def adjust_quantity(self, item_id, quantity_change):
         """Adjusts quantity for a specific item by a given amount (positive or negative)."""
@@ -95,7 +232,19 @@ class Inventory:
         if item.quantity + quantity_change < 0:
             raise ValueError("Insufficient quantity in stock.")
         item.quantity += quantity_change
-        logging.info(f"Adjusted quantity for {item.name}: {item.quantity} units remaining")
+        logger.info("Adjusted quantity for %s: %s units remaining", item.name, item.quantity)
+
+    def total_for(self, item_ids, quantities):
+        """Calculates the total discounted cost of the given item IDs and quantities."""
+        item_ids, quantities = list(item_ids), list(quantities)
+        if len(item_ids) != len(quantities):
+            raise ValueError("Item IDs and quantities must have the same length.")
+        items = self.items
+        try:
+            return sum((items[item_id].get_discounted_price() * quantity
+                        for item_id, quantity in zip(item_ids, quantities)), 0.0)
+        except KeyError:
+            raise ValueError("Item ID does not exist.") from None
 
     def find_item(self, item_id):
         """Finds an item by its ID, returns None if not found."""
@@ -103,37 +252,42 @@ class Inventory:
 
     def generate_report(self):
         """Prints a report of all items in inventory."""
-        print("\n--- Inventory Report ---")
-        for item in self.items.values():
-            print(item)
+        lines = ["\n--- Inventory Report ---", *map(str, self.items.values())]
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def search_items(self, name_keyword):
         """Searches for items by name keyword, printing results."""
-        results = [item for item in self.items.values() if name_keyword.lower() in item.name.lower()]
-        print(f"\n--- Search Results for '{name_keyword}' ---")
-        for item in results:
-            print(item)
+        keyword = name_keyword.lower()
+        results = [self.items[item_id] for item_id, name in self._names_lower.items() if keyword in name]
+        lines = [f"\n--- Search Results for '{name_keyword}' ---", *map(str, results)]
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def save_inventory(self, filename='inventory.json'):
         """Saves inventory to a JSON file."""
-        with open(filename, 'w') as file:
-            json.dump([item.to_dict() for item in self.items.values()], file)
+        _write_json(filename, [item.to_dict() for item in self.items.values()])
 
     def load_inventory(self, filename='inventory.json'):
         """Loads inventory from a JSON file if it exists."""
         if os.path.exists(filename):
-            with open(filename, 'r') as file:
-                items_data = json.load(file)
-                self.items = {item_data['item_id']: Item.from_dict(item_data) for item_data in items_data}
-            logging.info("Loaded inventory from file.")
+            items_data = _read_json(filename)
+            # Duplicate IDs in the file keep the last record, as plain dict loading always did
+            items = {item.item_id: item for item in map(Item.from_dict, items_data)}
+            # Build the new inventory completely before replacing the current one,
+            # so a bad record leaves the existing items untouched
+            loaded = Inventory()
+            loaded.add_items_bulk(items.values())
+            self.items, self._names_lower = loaded.items, loaded._names_lower
+            logger.info("Loaded inventory from file.")
         else:
             print("No inventory file found.")
-            logging.warning("Attempted to load non-existing inventory file.")
+            logger.warning("Attempted to load non-existing inventory file.")
 
 
 class User:
     """Class representing a user of the system."""
-    
+
+    __slots__ = ('username', 'role')
+
     def __init__(self, username, role='customer'):
         self.username = username
         self.role = role.lower()  # Role of user, either 'admin' or 'customer'
@@ -152,21 +306,29 @@ class User:
 class Sale:
     """Class to represent a completed sale."""
 
-    def __init__(self, items, total_cost, customer_name):
-        self.items = items  # List of items sold
+    __slots__ = ('item_names', 'item_quantities', 'total_cost', 'date', 'customer_name')
+
+    def __init__(self, item_names, item_quantities, total_cost, customer_name, date=None):
+        self.item_names = item_names  # Names of items sold
+        self.item_quantities = item_quantities  # Quantities sold, parallel to item_names
         self.total_cost = total_cost  # Total cost of the sale
-        self.date = datetime.datetime.now()  # Timestamp of sale
+        self.date = date or datetime.datetime.now()  # Timestamp of sale, defaults to now
         self.customer_name = customer_name  # Name of the customer
 
     def __str__(self):
         """Returns a string summary of the sale."""
-        items_str = ", ".join([f"{item['name']} x {item['quantity']}" for item in self.items])
+        items_str = ", ".join([f"{name} x {quantity}" for name, quantity in zip(self.item_names, self.item_quantities)])
         return f"Date: {self.date} | Customer: {self.customer_name} | Items: {items_str} | Total: ${self.total_cost:.2f}"
 
+    @property
+    def items(self):
+        """List of items sold as name/quantity dictionaries."""
+        return [{'name': name, 'quantity': quantity} for name, quantity in zip(self.item_names, self.item_quantities)]
+
     def to_dict(self):
         """Converts sale details to a dictionary for JSON serialization."""
         return {
-            'date': self.date.isoformat(),
+            'date': (self.date - _EPOCH).total_seconds(),  # Wall-clock seconds, cheaper to load than an ISO string
             'customer_name': self.customer_name,
             'items': self.items,
             'total_cost': self.total_cost
@@ -175,9 +337,14 @@ class Sale:
     @classmethod
     def from_dict(cls, data):
         """Creates a Sale instance from a dictionary (deserialization)."""
-        sale = cls(data['items'], data['total_cost'], data['customer_name'])
-        sale.date = datetime.datetime.fromisoformat(data['date'])
-        return sale
+        items = data['items']
+        date = data['date']
+        if isinstance(date, str):  # Files saved before dates were stored as timestamps
+            date = datetime.datetime.fromisoformat(date)
+        else:
+            date = _EPOCH + datetime.timedelta(seconds=date)
+        return cls([item['name'] for item in items], [item['quantity'] for item in items],
+                   data['total_cost'], data['customer_name'], date=date)
 
 
 class SalesHistory:
@@ -186,44 +353,47 @@ class SalesHistory:
     def __init__(self):
         # Initialize with an empty list to store Sale instances
         self.sales = []
+        self._total_revenue = 0  # Running total of sale costs, kept by record_sale
+        self._sales_by_day = defaultdict(list)  # Sales grouped by calendar date
 
     def record_sale(self, sale):
         """Records a sale by adding it to sales history."""
         self.sales.append(sale)
-        logging.info(f"Recorded sale: {sale}")
+        self._total_revenue += sale.total_cost
+        self._sales_by_day[sale.date.date()].append(sale)
+        logger.info("Recorded sale: %s", sale)
 
     def generate_sales_report(self):
         """Generates and prints a report of all sales."""
-        print("\n--- Sales Report ---")
-        for sale in self.sales:
-            print(sale)
-        print("Total Revenue:", self.get_total_revenue())
+        lines = ["\n--- Sales Report ---", *map(str, self.sales), f"Total Revenue: {self.get_total_revenue()}"]
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def get_total_revenue(self):
-        """Calculates total revenue from all recorded sales."""
-        return sum(sale.total_cost for sale in self.sales)
+        """Returns total revenue from all recorded sales."""
+        return self._total_revenue
 
     def get_sales_by_date(self, date):
         """Retrieves all sales that occurred on a specific date."""
-        date_sales = [sale for sale in self.sales if sale.date.date() == date]
-        return date_sales
+        return list(self._sales_by_day.get(date, ()))
 
     def save_sales_history(self, filename='sales_history.json'):
         """Saves sales history to a JSON file."""
-        with open(filename, 'w') as file:
-            json.dump([sale.to_dict() for sale in self.sales], file)
-        logging.info("Saved sales history to file.")
+        _write_json(filename, [sale.to_dict() for sale in self.sales])
+        logger.info("Saved sales history to file.")
 
     def load_sales_history(self, filename='sales_history.json'):
         """Loads sales history from a JSON file if it exists."""
         if os.path.exists(filename):
-            with open(filename, 'r') as file:
-                sales_data = json.load(file)
-                self.sales = [Sale.from_dict(sale_data) for sale_data in sales_data]
-            logging.info("Loaded sales history from file.")
+            sales_data = _read_json(filename)
+            self.sales = [Sale.from_dict(sale_data) for sale_data in sales_data]
+            self._total_revenue = sum(sale.total_cost for sale in self.sales)
+            self._sales_by_day = defaultdict(list)
+            for sale in self.sales:
+                self._sales_by_day[sale.date.date()].append(sale)
+            logger.info("Loaded sales history from file.")
         else:
             print("No sales history file found.")
-            logging.warning("Attempted to load non-existing sales history file.")
+            logger.warning("Attempted to load non-existing sales history file.")
 
 
 class Store:
@@ -259,11 +429,13 @@ class Store:
 
     def checkout_cart(self, cart, customer_name):
         """Processes checkout by calculating total cost and recording the sale."""
+        now = datetime.datetime.now()  # Single timestamp for the whole checkout
         total_cost = cart.checkout()
-        items = [{"name": item.item.name, "quantity": item.quantity} for item in cart.cart_items]
-        sale = Sale(items, total_cost, customer_name)
+        names = [cart_item.item.name for cart_item in cart.cart_items]
+        quantities = [cart_item.quantity for cart_item in cart.cart_items]
+        sale = Sale(names, quantities, total_cost, customer_name, date=now)
         self.sales_history.record_sale(sale)
-        logging.info(f"Checkout completed for {customer_name}: Total cost ${total_cost:.2f}")
+        logger.info("Checkout completed for %s: Total cost $%.2f", customer_name, total_cost)
         return total_cost
 
     def show_inventory(self):